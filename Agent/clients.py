@@ -0,0 +1,17 @@
+"""
+Shared API clients for the Agentic RAG system.
+A single ChatOpenAI instance is reused so its HTTP connection pool is shared.
+"""
+from langchain_core.caches import InMemoryCache
+from langchain_openai import ChatOpenAI
+
+import config as config
+
+
+# Exact-match cache: RAGAS re-issues identical judge prompts for repeated questions
+llm = ChatOpenAI(
+    model="gpt-4o-mini",
+    temperature=0.0,
+    openai_api_key=config.OPENAI_API_KEY,
+    cache=InMemoryCache(maxsize=1024)
+)
@@ -31,13 +31,40 @@ PDFS = [
 ]
 
 # Pinecone Configuration
-PINECONE_INDEX_NAME = "research-docs-index"
+# Index dimension must equal EMBEDDING_DIMENSIONS (cosine metric); re-run ingestion after changing it
+PINECONE_INDEX_NAME = "research-docs-index-512"
 DOCS_NAMESPACE = ""  # Default namespace for documents
 GROUND_TRUTH_NAMESPACE = "ground-truth"  # Namespace for ground truth
+PINECONE_POOL_THREADS = 30  # Threads for parallel upsert requests
+UPSERT_BATCH_SIZE = 64  # Vectors per upsert request
+METADATA_MAX_BYTES = 38000  # Stay under Pinecone's 40 KB per-vector metadata limit
+MAX_CONTENT_CHARS = 8000  # Stored chunk text is clipped to this length
 
 # Embedding Configuration
-EMBEDDING_MODEL = "text-embedding-3-large"
-EMBEDDING_DIMENSIONS = 1024
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIMENSIONS = 512
+EMBEDDING_CACHE_DIR = ".emb_cache"  # On-disk cache of query embeddings
+EMBEDDING_BATCH_SIZE = 2048  # Max texts per embeddings API request during ingestion (API limit)
+EMBEDDING_MAX_BATCH_TOKENS = 290_000  # Max tokens per embeddings request (API limit is 300k)
+EMBEDDING_MAX_CONCURRENCY = 5  # Embedding batches in flight at once during ingestion
+INGEST_EMBEDDING_CACHE_PATH = ".ingest_cache/embeddings.sqlite"  # Content-hash cache of chunk embeddings
+DEDUP_SIMILARITY_THRESHOLD = 0.97  # Chunks at least this similar to an earlier chunk are not upserted
+INGEST_PROGRESS_PATH = ".ingest_cache/ingest_progress-{index}-{namespace}.jsonl"  # IDs upserted by an interrupted run (removed once a run completes)
+
+# Retrieval Configuration
+RETRIEVAL_K_SCHEDULE = [5, 8]  # k per attempt; retries only run if they widen k
+GROUND_TRUTH_K = 3
+
+# Query Embedding Micro-Batching
+EMBED_BATCH_WINDOW_SECONDS = 0.05  # Collection window while another batch is in flight
+EMBED_BATCH_MAX_SIZE = 256
+
+# LLM Response Cache Configuration
+LLM_CACHE_SIMILARITY_THRESHOLD = 0.92
+LLM_CACHE_TTL_SECONDS = 3600
+
+# Workflow Checkpointing
+CHECKPOINT_MAX_THREADS = 256  # Unfinished runs kept for resume; oldest are evicted beyond this
 
 # Text Splitting Configuration
 CHUNK_SIZE = 1000
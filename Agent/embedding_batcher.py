@@ -0,0 +1,112 @@
+"""
+Micro-batching for query embeddings.
+Concurrent embed requests are coalesced into one batched embeddings API call.
+"""
+from typing import Dict, List, Optional, Set, Tuple, Union
+import asyncio
+
+import config as config
+
+
+class EmbeddingBatcher:
+    """Coalesces concurrent aembed_query calls into batched aembed_documents calls."""
+
+    def __init__(
+        self,
+        embeddings,
+        window_seconds: float = config.EMBED_BATCH_WINDOW_SECONDS,
+        max_batch_size: int = config.EMBED_BATCH_MAX_SIZE,
+    ):
+        """
+        Args:
+            embeddings: LangChain embeddings used for the batched calls
+            window_seconds: How long to collect requests while another batch is in flight
+            max_batch_size: Flush as soon as this many requests are waiting
+        """
+        self.embeddings = embeddings
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._in_flight = 0
+        # The loop only keeps weak references to tasks; hold them until they finish
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """
+        Embed one query, sharing the API call with other concurrent queries.
+
+        When idle, the batch is flushed on the next loop tick (so callers
+        awaiting together still share a call) and a lone request pays no
+        extra latency. While a batch is in flight, new requests wait up to
+        window_seconds to be grouped.
+
+        Args:
+            text: Query text
+
+        Returns:
+            List[float]: The query embedding
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            if self._in_flight == 0:
+                self._flush_handle = loop.call_soon(self._flush)
+            else:
+                self._flush_handle = loop.call_later(self.window_seconds, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """Send all pending requests as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            self._in_flight += 1
+            task = asyncio.ensure_future(self._embed_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _embed_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        """Embed a batch (deduplicating identical texts) and resolve each caller's future."""
+        unique_texts = list(dict.fromkeys(text for text, _ in batch))
+        try:
+            vectors = await self.embeddings.aembed_documents(unique_texts)
+            results = dict(zip(unique_texts, vectors))
+        except Exception as e:
+            if len(unique_texts) == 1:
+                results = {unique_texts[0]: e}
+            else:
+                # One rejected input (empty, too long) fails the whole call; embed the
+                # texts one by one so only the callers that sent it see the error
+                results = await self._embed_each(unique_texts)
+        finally:
+            self._in_flight -= 1
+
+        for text, future in batch:
+            if future.done():
+                continue
+            result = results[text]
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _embed_each(self, texts: List[str]) -> Dict[str, Union[List[float], BaseException]]:
+        """Embed texts individually, returning each text's vector or the exception it raised."""
+        outcomes = await asyncio.gather(
+            *(self.embeddings.aembed_documents([text]) for text in texts),
+            return_exceptions=True,
+        )
+        return {
+            text: outcome if isinstance(outcome, BaseException) else outcome[0]
+            for text, outcome in zip(texts, outcomes)
+        }
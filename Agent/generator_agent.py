@@ -1,34 +1,54 @@
-import json
-from langchain_core.messages import HumanMessage
-from langchain_openai import ChatOpenAI
-import config as config
+from functools import lru_cache
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableConfig
+from clients import llm
+from logger import logger
 from state import AgentState
 
 
-llm = ChatOpenAI(
-    model="gpt-4o-mini",
-    temperature=0.0,
-    openai_api_key=config.OPENAI_API_KEY,
-)
+@lru_cache(maxsize=None)
+def get_response_cache():
+    """
+    Response cache for generator answers, built on first use (faiss stays out of
+    import time). temperature=0 answers are deterministic, so repeated questions
+    can be served from cache. It shares the grader's disk-cached query embedder,
+    so looking up a question the grader already embedded costs no API call.
+    """
+    from llm_cache import SemanticLLMCache
+    from tools import get_query_embedder
 
+    return SemanticLLMCache(llm, get_query_embedder())
 
-def generator_agent(state: AgentState) -> AgentState:
+# Static instructions go first and are never interpolated, so the provider's
+# prompt cache can reuse the prefix across calls
+GENERATOR_SYSTEM_PROMPT = """
+You are a helpful technical assistant.
+
+Answer the question using ONLY the context provided.
+If the context does not contain the answer, say you do not know.
+""".strip()
+SYSTEM_MSG = SystemMessage(content=GENERATOR_SYSTEM_PROMPT)
+
+
+async def generator_agent(state: AgentState, config: RunnableConfig) -> AgentState:
     """
     Simple generator:
     - If retrieval is insufficient → return fallback.
     - Else → generate answer ONCE using retrieved context.
+
+    The answer is streamed from the LLM (so graph callers using
+    stream_mode="messages" see tokens as they arrive) and accumulated
+    into final_answer for non-streaming callers.
     """
     question = state["question"]
     is_sufficient = state.get("is_sufficient", False)
-    retrieved_docs_json = state.get("retrieved_docs_json", "")
+    docs = state.get("retrieved_docs", [])
 
-    print("\n" + "=" * 80)
-    print("🤖 GENERATOR AGENT")
-    print("=" * 80 + "\n")
+    logger.info("🤖 GENERATOR AGENT")
 
     # 1️⃣ If retrieval failed, do not generate
     if not is_sufficient:
-        print("  ⚠️ Retrieval insufficient → returning fallback.")
+        logger.info("⚠️ Retrieval insufficient → returning fallback.")
         fallback = (
             "Sorry, I don't have enough reliable information to answer this question.\n\n"
             "Please try:\n"
@@ -41,41 +61,38 @@ def generator_agent(state: AgentState) -> AgentState:
         }
 
     # 2️⃣ Build context from retrieved documents
-    try:
-        retrieved_data = json.loads(retrieved_docs_json)
-        docs = retrieved_data.get("documents", [])
-    except Exception:
-        docs = []
-
-    context_blocks = []
-    for doc in docs:
-        source = doc.get("source", "unknown")
-        content = doc.get("content", "")
-        context_blocks.append(f"[{source}]\n{content}")
+    # Dedupe and sort so the same set of chunks always produces a byte-identical prefix
+    context_blocks = sorted({
+        f"[{doc.metadata.get('source', 'unknown')}]\n{doc.page_content}"
+        for doc in docs
+    })
 
     context = "\n\n".join(context_blocks)
 
-    print(f"  📄 Generating answer using {len(docs)} context documents")
+    logger.info("📄 Generating answer using %d context documents", len(docs))
 
-    # 3️⃣ Generate answer ONCE
+    # 3️⃣ Generate answer ONCE (context before question to keep the prefix stable)
     prompt = f"""
-You are a helpful technical assistant.
-
-Answer the question using ONLY the context below.
-If the context does not contain the answer, say you do not know.
+Context:
+{context}
 
 Question:
 {question}
 
-Context:
-{context}
-
 Answer:
 """.strip()
 
-    response = llm.invoke([HumanMessage(content=prompt)])
+    # Passing config through keeps LangGraph's streaming callbacks attached
+    chunks = []
+    async for chunk in get_response_cache().astream(
+        [SYSTEM_MSG, HumanMessage(content=prompt)],
+        question=question,
+        context=context,
+        config=config,
+    ):
+        chunks.append(chunk)
 
     return {
         **state,
-        "final_answer": response.content,
+        "final_answer": "".join(chunks),
     }
\ No newline at end of file
@@ -0,0 +1,166 @@
+"""
+Semantic response cache for LLM calls.
+Exact repeats are matched by a hash of the model and messages; near-duplicate
+questions are matched by embedding similarity in an in-process FAISS index,
+but only when they were answered from exactly the same context.
+"""
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import hashlib
+import json
+import threading
+import time
+
+import faiss
+import numpy as np
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableConfig
+
+import config as config
+from logger import logger
+
+
+# Nearest cached questions checked for one answered from the same context
+_SEARCH_K = 8
+
+
+class SemanticLLMCache:
+    """Caches LLM responses by exact prompt and by question similarity over identical context."""
+
+    def __init__(
+        self,
+        llm,
+        embeddings,
+        similarity_threshold: float = config.LLM_CACHE_SIMILARITY_THRESHOLD,
+        ttl_seconds: int = config.LLM_CACHE_TTL_SECONDS,
+    ):
+        """
+        Args:
+            llm: Chat model used on cache misses
+            embeddings: Query embedder (anything with aembed_query) for question similarity
+            similarity_threshold: Minimum question cosine similarity for a semantic hit
+            ttl_seconds: How long a cached response stays valid
+        """
+        self.llm = llm
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+
+        self.embeddings = embeddings
+
+        # key -> (expires_at, response)
+        self._exact: Dict[str, Tuple[float, str]] = {}
+        # faiss id -> (expires_at, context_key, response); the index is created on first insert
+        self._semantic: Dict[int, Tuple[float, str, str]] = {}
+        self._index = None
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    async def astream(
+        self,
+        messages: List[BaseMessage],
+        question: str,
+        context: str,
+        config: Optional[RunnableConfig] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream the response for these messages, serving it from cache when possible.
+
+        A cache hit is yielded as a single chunk; on a miss the LLM output is
+        streamed token by token and cached once complete.
+
+        Args:
+            messages: Messages sent to the LLM
+            question: Question text, matched by embedding similarity
+            context: Retrieved context; a semantic hit requires it to match exactly
+            config: Runnable config forwarded to the LLM (callbacks, tracing)
+
+        Yields:
+            str: Response content chunks
+        """
+        key = self._exact_key(messages)
+        now = time.time()
+
+        with self._lock:
+            entry = self._exact.get(key)
+        if entry and entry[0] > now:
+            logger.info("⚡ LLM cache hit (exact)")
+            yield entry[1]
+            return
+
+        context_key = hashlib.sha256(context.encode("utf-8")).hexdigest()
+        vector = self._normalize(await self.embeddings.aembed_query(question))
+        cached = self._search(vector, context_key, now)
+        if cached is not None:
+            logger.info("⚡ LLM cache hit (semantic)")
+            yield cached
+            return
+
+        chunks = []
+        async for chunk in self.llm.astream(messages, config=config):
+            if chunk.content:
+                chunks.append(chunk.content)
+                yield chunk.content
+
+        self._insert(key, vector, context_key, "".join(chunks), now)
+
+    def _exact_key(self, messages: List[BaseMessage]) -> str:
+        """Hash the model name and message contents."""
+        payload = json.dumps(
+            {
+                "model": getattr(self.llm, "model_name", ""),
+                "messages": [[m.type, m.content] for m in messages],
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        """Convert an embedding to a normalized (1, dim) float32 row."""
+        vector = np.asarray([embedding], dtype=np.float32)
+        faiss.normalize_L2(vector)
+        return vector
+
+    def _search(self, vector: np.ndarray, context_key: str, now: float):
+        """Return the closest unexpired response above the threshold that used the same context, if any."""
+        with self._lock:
+            if self._index is None or self._index.ntotal == 0:
+                return None
+
+            scores, ids = self._index.search(vector, min(_SEARCH_K, self._index.ntotal))
+            for score, entry_id in zip(scores[0], ids[0]):
+                # Results are sorted by score, so nothing further can clear the threshold
+                if entry_id == -1 or score < self.similarity_threshold:
+                    return None
+
+                expires_at, entry_context_key, response = self._semantic[int(entry_id)]
+                if expires_at > now and entry_context_key == context_key:
+                    return response
+
+            return None
+
+    def _insert(self, key: str, vector: np.ndarray, context_key: str, response: str, now: float):
+        """Store a response under both the exact key and its embedding."""
+        expires_at = now + self.ttl_seconds
+
+        with self._lock:
+            self._evict_expired(now)
+
+            self._exact[key] = (expires_at, response)
+
+            if self._index is None:
+                self._index = faiss.IndexIDMap(faiss.IndexFlatIP(vector.shape[1]))
+            entry_id = self._next_id
+            self._next_id += 1
+            self._index.add_with_ids(vector, np.array([entry_id], dtype=np.int64))
+            self._semantic[entry_id] = (expires_at, context_key, response)
+
+    def _evict_expired(self, now: float):
+        """Drop expired entries (caller holds the lock)."""
+        for key in [k for k, (expires_at, _) in self._exact.items() if expires_at <= now]:
+            del self._exact[key]
+
+        expired_ids = [i for i, (expires_at, _, _) in self._semantic.items() if expires_at <= now]
+        if expired_ids:
+            self._index.remove_ids(np.array(expired_ids, dtype=np.int64))
+            for entry_id in expired_ids:
+                del self._semantic[entry_id]
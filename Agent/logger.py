@@ -0,0 +1,16 @@
+"""
+Logging setup for the Agentic RAG agent.
+All agent modules log through the single "agent" logger.
+"""
+import logging
+
+
+logger = logging.getLogger("agent")
+logger.setLevel(logging.INFO)
+
+# One handler for the whole process; guard against re-adding on re-import
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    logger.addHandler(_handler)
+    logger.propagate = False
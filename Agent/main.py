@@ -1,11 +1,16 @@
 import logging
+import uuid
 import warnings
+from collections import OrderedDict
+from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import StateGraph, END
 
+import config as config
 from state import AgentState
 from retrieval_grader_agent import retrieval_grader_agent
 from generator_agent import generator_agent
 from router import should_continue_retrieval
+from logger import logger
 
 from bedrock_agentcore.runtime import BedrockAgentCoreApp
 
@@ -41,32 +46,117 @@ def create_workflow():
     # Generator always ends the workflow
     graph.add_edge("generate", END)
 
-    return graph.compile()
+    # Checkpointing lets a retried request resume from its last completed node
+    return graph.compile(checkpointer=checkpointer)
 
 
+# In-memory checkpoints, kept only for runs that have not finished (see _track_thread)
+checkpointer = MemorySaver()
+
+# Thread ids with unfinished checkpoints, oldest first
+_open_threads: "OrderedDict[str, None]" = OrderedDict()
+
 # Create workflow once (outside entrypoint for reuse)
 workflow = create_workflow()
 
 
+def _track_thread(thread_id: str):
+    """Mark a thread as in progress, evicting the oldest unfinished threads beyond the cap."""
+    _open_threads[thread_id] = None
+    _open_threads.move_to_end(thread_id)
+    while len(_open_threads) > config.CHECKPOINT_MAX_THREADS:
+        stale_id, _ = _open_threads.popitem(last=False)
+        checkpointer.delete_thread(stale_id)
+
+
+def _finish_thread(thread_id: str):
+    """Drop a completed run's checkpoints; a finished run never needs resuming."""
+    _open_threads.pop(thread_id, None)
+    checkpointer.delete_thread(thread_id)
+
+
+async def _initial_inputs(inputs: dict, run_config: dict):
+    """
+    Return None (resume from the last checkpoint) if this thread has an unfinished
+    run for the same question, else the fresh inputs.
+    """
+    thread_id = run_config["configurable"]["thread_id"]
+    snapshot = await workflow.aget_state(run_config)
+    if not snapshot.next:
+        return inputs
+
+    if snapshot.values.get("question") == inputs["question"]:
+        logger.info("↩️ Resuming thread %s at %s", thread_id, snapshot.next)
+        return None
+
+    # A reused thread id with a new question must not be answered from the old run
+    logger.info("🧹 Discarding unfinished run on thread %s (new question)", thread_id)
+    checkpointer.delete_thread(thread_id)
+    return inputs
+
+
+async def stream_answer(inputs, run_config: dict):
+    """Yield answer tokens as the generator produces them, then the run metadata."""
+    final_state = inputs
+    streamed = False
+
+    async for mode, chunk in workflow.astream(inputs, config=run_config, stream_mode=["messages", "values"]):
+        if mode == "messages":
+            message, metadata = chunk
+            if metadata.get("langgraph_node") == "generate" and message.content:
+                streamed = True
+                yield message.content
+        else:
+            final_state = chunk
+
+    _finish_thread(run_config["configurable"]["thread_id"])
+
+    # The fallback answer and cache hits never reach the LLM, so send them whole
+    if not streamed:
+        yield final_state["final_answer"]
+
+    yield {
+        "metadata": {
+            "thread_id": run_config["configurable"]["thread_id"],
+            "is_sufficient": final_state["is_sufficient"],
+            "retrieval_count": final_state["retrieval_count"]
+        }
+    }
+
+
 # AgentCore Entrypoint
 @app.entrypoint
-def agent_invocation(payload, context):
+async def agent_invocation(payload, context):
     """Handler for agent invocation in AgentCore runtime"""
-    print("Received payload:", payload)
-    print("Context:", context)
+    logger.info("Received payload: %s | Context: %s", payload, context)
     
     # Extract question from payload
     question = payload.get("prompt", "")
-    
-    # Invoke the workflow
-    result = workflow.invoke({
+
+    inputs = {
         "question": question,
-        "messages": [],
         "retrieval_count": 0,
         "is_sufficient": False,
-        "retrieved_docs_json": "",
+        "retrieval_k": 0,
+        "query_hash": "",
+        "retrieved_docs": [],
         "final_answer": "",
-    })
+    }
+
+    # Clients retry a failed request by sending the same thread_id; the run then
+    # resumes from its last completed node instead of starting over
+    thread_id = payload.get("thread_id") or str(uuid.uuid4())
+    run_config = {"configurable": {"thread_id": thread_id}}
+    inputs = await _initial_inputs(inputs, run_config)
+    _track_thread(thread_id)
+
+    # Streaming callers get tokens as they are generated (AgentCore serves async generators as a stream)
+    if payload.get("stream", False):
+        return stream_answer(inputs, run_config)
+    
+    # Invoke the workflow
+    result = await workflow.ainvoke(inputs, config=run_config)
+    _finish_thread(thread_id)
     
     #print("Result:", result)
     
@@ -74,6 +164,7 @@ def agent_invocation(payload, context):
     return {
         "result": result["final_answer"],
         "metadata": {
+            "thread_id": thread_id,
             "is_sufficient": result["is_sufficient"],
             "retrieval_count": result["retrieval_count"]
         }
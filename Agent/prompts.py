@@ -1,4 +1,7 @@
-retriver_grader_prompt = f"""
+# Reference description of the retrieval + grading procedure.
+# retrieval_grader_agent now runs these steps as a fixed pipeline without an LLM;
+# the prompt is kept for documentation and for driving ALL_TOOLS from an agent.
+retriver_grader_prompt = """
 You are a Retrieval + Grading agent for a technical RAG system.
 
 You have access to these tools:
@@ -3,15 +3,15 @@ RAGAS evaluation module for RAG quality assessment.
 Handles all RAGAS metrics: context_precision, context_recall, faithfulness, answer_relevancy
 """
 from typing import List, Dict, Tuple
-from langchain_core.documents import Document
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-from ragas import evaluate
-from ragas.metrics import context_precision, context_recall, faithfulness, answer_relevancy
-from datasets import Dataset
+from langchain_openai import OpenAIEmbeddings
+import math
+import threading
 import warnings
 import logging
 
 import config as config
+from clients import llm
+from logger import logger
 
 # Suppress RAGAS progress bars and warnings
 warnings.filterwarnings('ignore')
@@ -20,26 +20,39 @@ logging.getLogger('httpx').setLevel(logging.ERROR)
 logging.getLogger('openai').setLevel(logging.ERROR)
 
 
+def _score(result_dict: Dict, metric: str) -> float:
+    """
+    Read a metric score. A failed or timed-out metric comes back as NaN and
+    scores 0.0, so it fails the sufficiency gate instead of passing it.
+    """
+    score = float(result_dict[metric])
+    if math.isnan(score):
+        logger.warning("⚠️ %s could not be computed; scoring it 0.0", metric)
+        return 0.0
+    return score
+
+
 class RAGASEvaluator:
     """Handles RAGAS evaluation for retrieval and generation quality."""
     
     def __init__(self):
-        """Initialize LLM and embeddings for RAGAS."""
-        self.llm = ChatOpenAI(
-            model="gpt-4o-mini",
-            temperature=0.0,
-            openai_api_key=config.OPENAI_API_KEY
-        )
+        """Initialize LLM (shared client) and embeddings for RAGAS."""
+        from ragas.run_config import RunConfig
+        
+        self.llm = llm
         
         self.embeddings = OpenAIEmbeddings(
             model="text-embedding-3-small",
             openai_api_key=config.OPENAI_API_KEY
         )
+        
+        # Run metric sub-calls concurrently; failed metrics come back as NaN (scored 0.0 by _score)
+        self.run_config = RunConfig(max_workers=16, timeout=60)
     
     def evaluate_retrieval(
         self,
         question: str,
-        retrieved_docs: List[Document],
+        contexts: List[str],
         ground_truth_answer: str
     ) -> Tuple[float, float]:
         """
@@ -47,20 +60,22 @@ class RAGASEvaluator:
         
         Args:
             question: The user's question
-            retrieved_docs: List of retrieved document chunks
+            contexts: Text of the retrieved document chunks
             ground_truth_answer: Expected answer from golden dataset
             
         Returns:
             Tuple[float, float]: (precision_score, recall_score)
         """
+        # Deferred: ragas/datasets are heavy and only needed once evaluation runs
+        from ragas import evaluate
+        from ragas.metrics import context_precision, context_recall
+        from datasets import Dataset
+        
         try:
-            # Prepare contexts
-            retrieved_contexts = [str(doc.page_content) for doc in retrieved_docs]
-            
             # Create dataset
             eval_data = {
                 "question": [question],
-                "contexts": [retrieved_contexts],
+                "contexts": [contexts],
                 "ground_truth": [ground_truth_answer]
             }
             
@@ -72,28 +87,30 @@ class RAGASEvaluator:
                 metrics=[context_precision, context_recall],
                 llm=self.llm,
                 embeddings=self.embeddings,
+                run_config=self.run_config,
+                raise_exceptions=False,
                 show_progress=False  # Disable progress bar
             )
             
             # Extract scores
             result_dict = result.to_pandas().to_dict('records')[0]
-            precision = float(result_dict['context_precision'])
-            recall = float(result_dict['context_recall'])
+            precision = _score(result_dict, 'context_precision')
+            recall = _score(result_dict, 'context_recall')
             
             return precision, recall
             
         except Exception as e:
-            print(f"    ⚠️ RAGAS evaluation error: {str(e)}")
+            logger.warning("⚠️ RAGAS evaluation error: %s", e)
             # Fallback heuristic
-            precision = 0.8 if len(retrieved_docs) >= 3 else 0.5
-            recall = 0.8 if len(retrieved_docs) >= 3 else 0.5
+            precision = 0.8 if len(contexts) >= 3 else 0.5
+            recall = 0.8 if len(contexts) >= 3 else 0.5
             return precision, recall
     
     def evaluate_answer(
         self,
         question: str,
         answer: str,
-        retrieved_docs: List[Document]
+        contexts: List[str]
     ) -> Tuple[float, float]:
         """
         Evaluate answer quality using faithfulness and answer_relevancy.
@@ -101,20 +118,22 @@ class RAGASEvaluator:
         Args:
             question: The user's question
             answer: The generated answer
-            retrieved_docs: List of retrieved document chunks used for generation
+            contexts: Text of the document chunks used for generation
             
         Returns:
             Tuple[float, float]: (faithfulness_score, relevancy_score)
         """
+        # Deferred: ragas/datasets are heavy and only needed once evaluation runs
+        from ragas import evaluate
+        from ragas.metrics import faithfulness, answer_relevancy
+        from datasets import Dataset
+        
         try:
-            # Prepare contexts
-            retrieved_contexts = [str(doc.page_content) for doc in retrieved_docs]
-            
             # Create dataset
             validation_data = {
                 "question": [question],
                 "answer": [answer],
-                "contexts": [retrieved_contexts]
+                "contexts": [contexts]
             }
             
             dataset = Dataset.from_dict(validation_data)
@@ -125,32 +144,120 @@ class RAGASEvaluator:
                 metrics=[faithfulness, answer_relevancy],
                 llm=self.llm,
                 embeddings=self.embeddings,
+                run_config=self.run_config,
+                raise_exceptions=False,
                 show_progress=False  # Disable progress bar
             )
             
             # Extract scores
             result_dict = result.to_pandas().to_dict('records')[0]
-            faithfulness_score = float(result_dict['faithfulness'])
-            relevancy_score = float(result_dict['answer_relevancy'])
+            faithfulness_score = _score(result_dict, 'faithfulness')
+            relevancy_score = _score(result_dict, 'answer_relevancy')
             
             return faithfulness_score, relevancy_score
             
         except Exception as e:
-            print(f"    ⚠️ Answer evaluation error: {str(e)}")
+            logger.warning("⚠️ Answer evaluation error: %s", e)
             # Conservative fallback
             faithfulness_score = 0.8
             relevancy_score = 0.8
             return faithfulness_score, relevancy_score
 
+    def evaluate_all(
+        self,
+        question: str,
+        answer: str,
+        contexts: List[str],
+        ground_truth_answer: str
+    ) -> Dict[str, float]:
+        """
+        Evaluate retrieval and answer quality with all four metrics in one RAGAS run.
+        
+        Args:
+            question: The user's question
+            answer: The generated answer
+            contexts: Text of the document chunks used for generation
+            ground_truth_answer: Expected answer from golden dataset
+            
+        Returns:
+            Dict[str, float]: context_precision, context_recall, faithfulness, answer_relevancy
+        """
+        # Deferred: ragas/datasets are heavy and only needed once evaluation runs
+        from ragas import evaluate
+        from ragas.metrics import context_precision, context_recall, faithfulness, answer_relevancy
+        from datasets import Dataset
+        
+        try:
+            # Create dataset with the columns every metric needs
+            eval_data = {
+                "question": [question],
+                "answer": [answer],
+                "contexts": [contexts],
+                "ground_truth": [ground_truth_answer]
+            }
+            
+            dataset = Dataset.from_dict(eval_data)
+            
+            # One evaluate() call lets RAGAS dispatch all metric LLM calls concurrently
+            result = evaluate(
+                dataset,
+                metrics=[context_precision, context_recall, faithfulness, answer_relevancy],
+                llm=self.llm,
+                embeddings=self.embeddings,
+                run_config=self.run_config,
+                raise_exceptions=False,
+                show_progress=False  # Disable progress bar
+            )
+            
+            # Extract scores
+            result_dict = result.to_pandas().to_dict('records')[0]
+            return {
+                "context_precision": _score(result_dict, 'context_precision'),
+                "context_recall": _score(result_dict, 'context_recall'),
+                "faithfulness": _score(result_dict, 'faithfulness'),
+                "answer_relevancy": _score(result_dict, 'answer_relevancy'),
+            }
+            
+        except Exception as e:
+            logger.warning("⚠️ RAGAS evaluation error: %s", e)
+            # Same fallbacks as evaluate_retrieval / evaluate_answer
+            retrieval_fallback = 0.8 if len(contexts) >= 3 else 0.5
+            return {
+                "context_precision": retrieval_fallback,
+                "context_recall": retrieval_fallback,
+                "faithfulness": 0.8,
+                "answer_relevancy": 0.8,
+            }
+
+
+_default_evaluator = None
+_default_evaluator_lock = threading.Lock()
+
+
+def get_evaluator() -> RAGASEvaluator:
+    """Return the shared RAGASEvaluator, creating it on first use (thread-safe: callers run in worker threads)."""
+    global _default_evaluator
+    if _default_evaluator is None:
+        with _default_evaluator_lock:
+            if _default_evaluator is None:
+                _default_evaluator = RAGASEvaluator()
+    return _default_evaluator
+
 
 # Convenience functions
-def evaluate_retrieval(question: str, retrieved_docs: List[Document], ground_truth: str) -> Tuple[float, float]:
+def evaluate_retrieval(question: str, contexts: List[str], ground_truth: str) -> Tuple[float, float]:
     """Quick function to evaluate retrieval quality."""
-    evaluator = RAGASEvaluator()
-    return evaluator.evaluate_retrieval(question, retrieved_docs, ground_truth)
+    evaluator = get_evaluator()
+    return evaluator.evaluate_retrieval(question, contexts, ground_truth)
 
 
-def evaluate_answer(question: str, answer: str, retrieved_docs: List[Document]) -> Tuple[float, float]:
+def evaluate_answer(question: str, answer: str, contexts: List[str]) -> Tuple[float, float]:
     """Quick function to evaluate answer quality."""
-    evaluator = RAGASEvaluator()
-    return evaluator.evaluate_answer(question, answer, retrieved_docs)
\ No newline at end of file
+    evaluator = get_evaluator()
+    return evaluator.evaluate_answer(question, answer, contexts)
+
+
+def evaluate_all(question: str, answer: str, contexts: List[str], ground_truth: str) -> Dict[str, float]:
+    """Quick function to evaluate retrieval and answer quality in one run."""
+    evaluator = get_evaluator()
+    return evaluator.evaluate_all(question, answer, contexts, ground_truth)
\ No newline at end of file
@@ -1,24 +1,47 @@
+import hashlib
+import config as config
+from logger import logger
 from state import AgentState
 
 
+def retrieval_k_for_attempt(attempt_index: int) -> int:
+    """Return k for the given 0-based attempt; later attempts widen the search."""
+    schedule = config.RETRIEVAL_K_SCHEDULE
+    return schedule[min(attempt_index, len(schedule) - 1)]
+
+
+def query_hash(query: str) -> str:
+    """Short stable hash identifying the query text used for an attempt."""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()[:16]
+
+
 def should_continue_retrieval(state: AgentState) -> str:
     """
     Decide whether to:
-    - retry retrieval (if not sufficient and attempts < 2)
-    - or stop (END) after success or after 2 attempts
+    - retry retrieval (if not sufficient, attempts < 2 and the next attempt
+      would use a larger k or a different query)
+    - or stop (END) after success, after 2 attempts, or when a retry would
+      just repeat the same search
     """
     is_sufficient = state.get("is_sufficient", False)
     retrieval_count = state.get("retrieval_count", 0)
 
     if is_sufficient:
-        print(f"\n  ✅ ROUTING: Documents sufficient → END")
+        logger.info("✅ ROUTING: Documents sufficient → END")
         return "stop"
 
     if retrieval_count >= 2:
         # We already tried 2 times; don't keep looping forever
-        print(f"\n  ⚠️ ROUTING: Max attempts reached (2) → END")
+        logger.info("⚠️ ROUTING: Max attempts reached (2) → END")
+        return "stop"
+
+    # Same query + same k returns the same top-k and the same verdict
+    next_attempt = (retrieval_k_for_attempt(retrieval_count), query_hash(state["question"]))
+    last_attempt = (state.get("retrieval_k", 0), state.get("query_hash", ""))
+    if next_attempt == last_attempt:
+        logger.info("⚠️ ROUTING: Retry would repeat the same search (k=%d) → END", last_attempt[0])
         return "stop"
 
     # Otherwise, try retrieval again
-    print(f"\n  🔄 ROUTING: Insufficient → Retry Retrieval ({retrieval_count}/2 so far)")
-    return "retry"
\ No newline at end of file
+    logger.info("🔄 ROUTING: Insufficient → Retry Retrieval (%d/2 so far)", retrieval_count)
+    return "retry"
@@ -1,10 +1,11 @@
-from typing import List, TypedDict, Annotated
-import operator
+from typing import List, TypedDict
+from langchain_core.documents import Document
 
 class AgentState(TypedDict):
     question: str
-    messages: Annotated[List, operator.add]
     retrieval_count: int          # how many retrieval attempts so far
     is_sufficient: bool           # is retrieval good enough?
-    retrieved_docs_json: str 
+    retrieval_k: int              # k used by the last attempt
+    query_hash: str               # hash of the query used by the last attempt
+    retrieved_docs: List[Document]  # chunks from the last retrieval attempt
     final_answer: str
\ No newline at end of file
@@ -1,72 +1,108 @@
 """
 All tools for the agentic RAG system.
-LLM will decide which tools to call autonomously.
+The graph runs retrieval and grading as a fixed pipeline that calls the
+retrieval helpers and grade_retrieval directly (no LLM tool selection);
+the @tool wrappers in ALL_TOOLS expose the same steps to any agent that
+wants to drive them, e.g. evaluate_rag_quality for offline evaluation.
 """
 from typing import List
+from functools import lru_cache
+import asyncio
 from langchain_core.tools import tool
 from langchain_core.documents import Document
-#from langchain_pinecone import PineconeVectorStore
-from langchain_pinecone import Pinecone
 from langchain_openai import OpenAIEmbeddings
-from ragas_evaluator import RAGASEvaluator
+from langchain.embeddings import CacheBackedEmbeddings
+from langchain.storage import LocalFileStore
+from embedding_batcher import EmbeddingBatcher
+from ragas_evaluator import get_evaluator
 import json
 
 import config as config
 
 
-# Initialize embeddings
-embeddings = OpenAIEmbeddings(
-    model=config.EMBEDDING_MODEL,
-    dimensions=config.EMBEDDING_DIMENSIONS,
-    openai_api_key=config.OPENAI_API_KEY
-)
+# Clients are built on first use so importing this module (and main.py) stays cheap
 
-# Initialize vector stores
-docs_vectorstore = Pinecone.from_existing_index(
-    index_name=config.PINECONE_INDEX_NAME,
-    embedding=embeddings,
-    namespace=config.DOCS_NAMESPACE
-)
+@lru_cache(maxsize=None)
+def get_embeddings() -> CacheBackedEmbeddings:
+    """
+    Query embeddings, disk-cached so retry attempts don't re-embed the same query.
+    Queries reach this through EmbeddingBatcher, which calls aembed_documents,
+    so the document-embedding cache is the one in use.
+    """
+    return CacheBackedEmbeddings.from_bytes_store(
+        OpenAIEmbeddings(
+            model=config.EMBEDDING_MODEL,
+            dimensions=config.EMBEDDING_DIMENSIONS,
+            openai_api_key=config.OPENAI_API_KEY
+        ),
+        LocalFileStore(config.EMBEDDING_CACHE_DIR),
+        namespace=f"{config.EMBEDDING_MODEL}-{config.EMBEDDING_DIMENSIONS}",
+        key_encoder="sha256"
+    )
+
+
+@lru_cache(maxsize=None)
+def get_query_embedder() -> EmbeddingBatcher:
+    """Query embedder that batches concurrent requests into one API call."""
+    return EmbeddingBatcher(get_embeddings())
 
-gt_vectorstore = Pinecone.from_existing_index(
-    index_name=config.PINECONE_INDEX_NAME,
-    embedding=embeddings,
-    namespace=config.GROUND_TRUTH_NAMESPACE
-)
 
-# Initialize RAGAS evaluator
-ragas_eval = RAGASEvaluator()
+@lru_cache(maxsize=None)
+def get_index():
+    """
+    One Pinecone index handle serving both namespaces (documents + ground truth).
+    Uses the gRPC client: one persistent HTTP/2 connection with multiplexed queries.
+    """
+    from pinecone.grpc import PineconeGRPC
+
+    return PineconeGRPC(api_key=config.PINECONE_API_KEY).Index(config.PINECONE_INDEX_NAME)
 
 
 # ============================================
-# RETRIEVAL TOOLS
+# RETRIEVAL HELPERS
 # ============================================
 
-@tool
-def retrieve_documents(query: str, k: int = 5) -> str:
+async def query_namespace(vector: List[float], namespace: str, k: int) -> List[Document]:
     """
-    Retrieve relevant document chunks from the research papers knowledge base.
-    
-    Use this tool to get information from research papers (Transformer, BERT, CLIP).
+    Query one Pinecone namespace with a precomputed query embedding.
     
     Args:
-        query: The search query or question
-        k: Number of documents to retrieve (default: 5, can increase to 8 for broader search)
+        vector: Query embedding
+        namespace: Pinecone namespace to search
+        k: Number of matches to return
         
     Returns:
-        JSON string containing retrieved documents with metadata
+        List[Document]: Matches with their stored text and metadata
     """
-    retriever = docs_vectorstore.as_retriever(search_kwargs={"k": k})
-    docs = retriever.invoke(query)
+    # get_index() runs in the worker too: the first call does a blocking index lookup
+    response = await asyncio.to_thread(
+        lambda: get_index().query(
+            vector=vector,
+            top_k=k,
+            namespace=namespace,
+            include_metadata=True
+        )
+    )
     
-    # Format as JSON for LLM
+    docs = []
+    for match in response.matches:
+        metadata = dict(match.metadata or {})
+        # Ingestion stores the chunk text under the "text" metadata key
+        text = metadata.pop("text", "")
+        docs.append(Document(id=match.id, page_content=text, metadata=metadata))
+    return docs
+
+
+def format_documents(docs: List[Document]) -> str:
+    """Format retrieved document chunks as JSON for the LLM."""
     results = []
     for i, doc in enumerate(docs):
         results.append({
             "chunk_id": i,
             "source": doc.metadata.get("source", "unknown"),
             "paper": doc.metadata.get("paper_id", "unknown"),
-            "content": doc.page_content[:500]  # Truncate for readability
+            "content_preview": doc.page_content[:500],  # Truncated for readability
+            "full_content": doc.page_content  # Untruncated text for evaluation
         })
     
     return json.dumps({
@@ -75,24 +111,14 @@ def retrieve_documents(query: str, k: int = 5) -> str:
     }, indent=2)
 
 
-@tool
-def retrieve_ground_truth(query: str, k: int = 3) -> str:
-    """
-    Retrieve similar ground truth question-answer pairs for validation.
-    
-    Use this tool to find expected answers and evaluation criteria from the golden dataset.
-    
-    Args:
-        query: The question to find similar ground truth for
-        k: Number of ground truth examples to retrieve (default: 3)
-        
-    Returns:
-        JSON string containing ground truth Q&A pairs with expected criteria
-    """
-    retriever = gt_vectorstore.as_retriever(search_kwargs={"k": k})
-    docs = retriever.invoke(query)
-    
-    # Format as JSON for LLM
+def parse_contexts(retrieved_docs_json: str) -> List[str]:
+    """Extract the full chunk texts from format_documents JSON."""
+    retrieved_data = json.loads(retrieved_docs_json)
+    return [doc_data["full_content"] for doc_data in retrieved_data.get("documents", [])]
+
+
+def format_ground_truth(docs: List[Document]) -> str:
+    """Format retrieved ground truth Q&A pairs as JSON for the LLM."""
     results = []
     for i, doc in enumerate(docs):
         results.append({
@@ -109,10 +135,86 @@ def retrieve_ground_truth(query: str, k: int = 3) -> str:
     }, indent=2)
 
 
+# ============================================
+# RETRIEVAL TOOLS
+# ============================================
+
+@tool
+async def retrieve_documents(query: str, k: int = 5) -> str:
+    """
+    Retrieve relevant document chunks from the research papers knowledge base.
+    
+    Use this tool to get information from research papers (Transformer, BERT, CLIP).
+    
+    Args:
+        query: The search query or question
+        k: Number of documents to retrieve (default: 5, can increase to 8 for broader search)
+        
+    Returns:
+        JSON string containing retrieved documents with metadata
+    """
+    vector = await get_query_embedder().aembed_query(query)
+    docs = await query_namespace(vector, config.DOCS_NAMESPACE, k)
+    return format_documents(docs)
+
+
+@tool
+async def retrieve_ground_truth(query: str, k: int = 3) -> str:
+    """
+    Retrieve similar ground truth question-answer pairs for validation.
+    
+    Use this tool to find expected answers and evaluation criteria from the golden dataset.
+    
+    Args:
+        query: The question to find similar ground truth for
+        k: Number of ground truth examples to retrieve (default: 3)
+        
+    Returns:
+        JSON string containing ground truth Q&A pairs with expected criteria
+    """
+    vector = await get_query_embedder().aembed_query(query)
+    docs = await query_namespace(vector, config.GROUND_TRUTH_NAMESPACE, k)
+    return format_ground_truth(docs)
+
+
 # ============================================
 # RAGAS EVALUATION TOOLS
 # ============================================
 
+def grade_retrieval(question: str, contexts: List[str], ground_truth_answer: str) -> dict:
+    """
+    Score retrieved documents with RAGAS and apply the sufficiency threshold.
+    
+    Args:
+        question: The original question
+        contexts: Text of the retrieved document chunks
+        ground_truth_answer: Expected answer from ground truth
+        
+    Returns:
+        dict: precision, recall scores and sufficiency decision
+    """
+    # Fewer than 2 chunks can never be sufficient, so skip the RAGAS LLM calls
+    if len(contexts) < 2:
+        return {
+            "context_precision": 0.0,
+            "context_recall": 0.0,
+            "is_sufficient": False,
+            "recommendation": "Retrieve more documents"
+        }
+    
+    precision, recall = get_evaluator().evaluate_retrieval(question, contexts, ground_truth_answer)
+    
+    # Determine sufficiency
+    is_sufficient = precision >= 0.7 and recall >= 0.7
+    
+    return {
+        "context_precision": round(precision, 3),
+        "context_recall": round(recall, 3),
+        "is_sufficient": is_sufficient,
+        "recommendation": "Proceed to generation" if is_sufficient else "Retrieve more documents"
+    }
+
+
 @tool
 def evaluate_retrieval_quality(question: str, retrieved_docs_json: str, ground_truth_answer: str) -> str:
     """
@@ -130,30 +232,11 @@ def evaluate_retrieval_quality(question: str, retrieved_docs_json: str, ground_t
         JSON with precision, recall scores and sufficiency decision
     """
     try:
-        # Parse retrieved docs
-        retrieved_data = json.loads(retrieved_docs_json)
-        
-        # Reconstruct Document objects for RAGAS
-        docs = []
-        for doc_data in retrieved_data.get("documents", []):
-            doc = Document(
-                page_content=doc_data["content"],
-                metadata={"source": doc_data["source"]}
-            )
-            docs.append(doc)
+        # Full chunk texts from the retrieved docs JSON
+        contexts = parse_contexts(retrieved_docs_json)
         
         # Evaluate with RAGAS
-        precision, recall = ragas_eval.evaluate_retrieval(question, docs, ground_truth_answer)
-        
-        # Determine sufficiency
-        is_sufficient = precision >= 0.7 and recall >= 0.7
-        
-        return json.dumps({
-            "context_precision": round(precision, 3),
-            "context_recall": round(recall, 3),
-            "is_sufficient": is_sufficient,
-            "recommendation": "Proceed to generation" if is_sufficient else "Retrieve more documents"
-        }, indent=2)
+        return json.dumps(grade_retrieval(question, contexts, ground_truth_answer), indent=2)
         
     except Exception as e:
         return json.dumps({"error": str(e)}, indent=2)
@@ -176,20 +259,11 @@ def evaluate_answer_quality(question: str, answer: str, retrieved_docs_json: str
         JSON with faithfulness, relevancy scores and quality decision
     """
     try:
-        # Parse retrieved docs
-        retrieved_data = json.loads(retrieved_docs_json)
-        
-        # Reconstruct Document objects
-        docs = []
-        for doc_data in retrieved_data.get("documents", []):
-            doc = Document(
-                page_content=doc_data["content"],
-                metadata={"source": doc_data["source"]}
-            )
-            docs.append(doc)
+        # Full chunk texts from the retrieved docs JSON
+        contexts = parse_contexts(retrieved_docs_json)
         
         # Evaluate with RAGAS
-        faithfulness, relevancy = ragas_eval.evaluate_answer(question, answer, docs)
+        faithfulness, relevancy = get_evaluator().evaluate_answer(question, answer, contexts)
         
         # Determine quality
         is_good_quality = faithfulness >= 0.7 and relevancy >= 0.7
@@ -205,10 +279,50 @@ def evaluate_answer_quality(question: str, answer: str, retrieved_docs_json: str
         return json.dumps({"error": str(e)}, indent=2)
 
 
+@tool
+def evaluate_rag_quality(question: str, answer: str, retrieved_docs_json: str, ground_truth_answer: str) -> str:
+    """
+    Evaluate retrieval and answer quality together using all RAGAS metrics.
+    
+    Use this tool instead of calling evaluate_retrieval_quality and
+    evaluate_answer_quality one after the other on a finished answer.
+    
+    Args:
+        question: The original question
+        answer: The generated answer to evaluate
+        retrieved_docs_json: JSON string of documents used for generation
+        ground_truth_answer: Expected answer from ground truth
+        
+    Returns:
+        JSON with precision, recall, faithfulness, relevancy scores and decisions
+    """
+    try:
+        # Full chunk texts from the retrieved docs JSON
+        contexts = parse_contexts(retrieved_docs_json)
+        
+        # Evaluate with RAGAS (single run for all four metrics)
+        scores = get_evaluator().evaluate_all(question, answer, contexts, ground_truth_answer)
+        
+        # Determine sufficiency and quality
+        is_sufficient = scores["context_precision"] >= 0.7 and scores["context_recall"] >= 0.7
+        is_good_quality = scores["faithfulness"] >= 0.7 and scores["answer_relevancy"] >= 0.7
+        
+        return json.dumps({
+            **{name: round(score, 3) for name, score in scores.items()},
+            "is_sufficient": is_sufficient,
+            "is_good_quality": is_good_quality,
+            "recommendation": "Return answer to user" if is_sufficient and is_good_quality else "Answer quality insufficient"
+        }, indent=2)
+        
+    except Exception as e:
+        return json.dumps({"error": str(e)}, indent=2)
+
+
 # Export all tools
 ALL_TOOLS = [
     retrieve_documents,
     retrieve_ground_truth,
     evaluate_retrieval_quality,
-    evaluate_answer_quality
+    evaluate_answer_quality,
+    evaluate_rag_quality
 ]
\ No newline at end of file
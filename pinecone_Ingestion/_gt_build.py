@@ -0,0 +1,32 @@
+"""
+Text assembly for ground truth Q&A records.
+Kept dependency-free and fully typed so it can be compiled with mypyc
+(`mypyc _gt_build.py`); the pure-Python module is used when not compiled.
+"""
+from typing import List
+
+
+def build_contents(questions: List[str], answers: List[str], golds: List[List[str]]) -> List[str]:
+    """
+    Build the embedded text for each Q&A pair.
+
+    Each record is assembled with a single str.join (no intermediate strings):
+    "Question: ...\\nAnswer: ..." plus a "Gold Chunks:" section when present.
+
+    Args:
+        questions: Question per pair
+        answers: Answer per pair
+        golds: Gold chunks per pair (may be empty)
+
+    Returns:
+        List[str]: Content per pair, in input order
+    """
+    contents: List[str] = []
+    for i in range(len(questions)):
+        gold: List[str] = golds[i]
+        if gold:
+            parts = ["Question: ", questions[i], "\nAnswer: ", answers[i], "\n\nGold Chunks:\n", "\n".join(gold)]
+        else:
+            parts = ["Question: ", questions[i], "\nAnswer: ", answers[i]]
+        contents.append("".join(parts))
+    return contents
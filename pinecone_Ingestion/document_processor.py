@@ -9,6 +9,11 @@ from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 import Agent.config as config
+from utils import log
+
+
+# Banner rule, built once
+_BAR60 = "=" * 60
 
 
 def load_papers() -> List[Document]:
@@ -20,9 +25,9 @@ def load_papers() -> List[Document]:
     """
     docs = []
     
-    print(f"\n{'='*60}")
-    print("📄 LOADING RESEARCH PAPERS WITH DOCLING")
-    print(f"{'='*60}\n")
+    log(f"\n{_BAR60}")
+    log("📄 LOADING RESEARCH PAPERS WITH DOCLING")
+    log(f"{_BAR60}\n")
 
     for fname in config.PDFS:
         pdf_path = config.DATA_DIR / fname
@@ -30,7 +35,7 @@ def load_papers() -> List[Document]:
         if not pdf_path.exists():
             raise FileNotFoundError(f"Missing file: {pdf_path.resolve()}")
 
-        print(f"Processing: {fname}")
+        log(f"Processing: {fname}")
         
         # Load document with Docling
         loader = DoclingLoader(
@@ -39,7 +44,7 @@ def load_papers() -> List[Document]:
         )
         
         file_docs = loader.load()
-        print(f"  ✓ Loaded {len(file_docs)} document(s)")
+        log(f"  ✓ Loaded {len(file_docs)} document(s)")
 
         # Tag metadata - CONVERT ALL VALUES TO STRINGS
         for d in file_docs:
@@ -58,7 +63,7 @@ def load_papers() -> List[Document]:
 
         docs.extend(file_docs)
     
-    print(f"\n✓ Total documents loaded: {len(docs)}")
+    log(f"\n✓ Total documents loaded: {len(docs)}")
     return docs
 
 
@@ -72,9 +77,9 @@ def split_documents(docs: List[Document]) -> List[Document]:
     Returns:
         List[Document]: List of document chunks
     """
-    print(f"\n{'='*60}")
-    print("✂️  SPLITTING DOCUMENTS INTO CHUNKS")
-    print(f"{'='*60}\n")
+    log(f"\n{_BAR60}")
+    log("✂️  SPLITTING DOCUMENTS INTO CHUNKS")
+    log(f"{_BAR60}\n")
     
     text_splitter = RecursiveCharacterTextSplitter(
         chunk_size=config.CHUNK_SIZE,
@@ -91,9 +96,9 @@ def split_documents(docs: List[Document]) -> List[Document]:
             if isinstance(value, Path):
                 split.metadata[key] = str(value)
     
-    print(f"✓ Split {len(docs)} documents into {len(splits)} chunks")
-    print(f"  • Chunk size: {config.CHUNK_SIZE} characters")
-    print(f"  • Chunk overlap: {config.CHUNK_OVERLAP} characters")
+    log(f"✓ Split {len(docs)} documents into {len(splits)} chunks")
+    log(f"  • Chunk size: {config.CHUNK_SIZE} characters")
+    log(f"  • Chunk overlap: {config.CHUNK_OVERLAP} characters")
     
     return splits
 
@@ -110,11 +115,11 @@ def process_documents() -> List[Document]:
     
     # Show sample document
     if docs:
-        print(f"\n{'='*60}")
-        print("📋 SAMPLE DOCUMENT")
-        print(f"{'='*60}")
-        print(f"Metadata: {docs[0].metadata}")
-        print(f"Content preview: {docs[0].page_content[:200]}...")
+        log(f"\n{_BAR60}")
+        log("📋 SAMPLE DOCUMENT")
+        log(f"{_BAR60}")
+        log(f"Metadata: {docs[0].metadata}")
+        log(f"Content preview: {docs[0].page_content[:200]}...")
     
     # Split documents
     chunks = split_documents(docs)
@@ -125,4 +130,4 @@ def process_documents() -> List[Document]:
 if __name__ == "__main__":
     # Test the processor
     chunks = process_documents()
-    print(f"\n✅ Processing complete! Generated {len(chunks)} chunks ready for storage.")
\ No newline at end of file
+    log(f"\n✅ Processing complete! Generated {len(chunks)} chunks ready for storage.")
\ No newline at end of file
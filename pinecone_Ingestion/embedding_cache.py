@@ -0,0 +1,171 @@
+"""
+Persistent embedding cache for the ingestion pipeline.
+Vectors are keyed by (sha256(text), model, dimensions), so re-ingesting
+unchanged chunks skips the embeddings API entirely.
+Vectors live in a contiguous int8 np.memmap file (one row per vector, 4x
+smaller than float32); a small SQLite table maps each hash to its row and
+per-vector float32 scale. Cached vectors are never upserted: a hit is only
+used for chunks Pinecone already stores unchanged, so Pinecone stays FP32.
+"""
+from typing import Dict, Iterator, List
+from contextlib import contextmanager
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+
+import numpy as np
+
+
+# Stay under SQLite's bound-parameter limit for "IN (...)" lookups
+_LOOKUP_BATCH = 900
+
+# Rows allocated when the vectors file is first created (doubled whenever it fills up)
+_INITIAL_CAPACITY = 1024
+
+
+def content_hash(text: str) -> str:
+    """Return the cache key for a chunk of text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Memmap-backed store of int8-quantized embeddings for one model/dimension pair."""
+
+    def __init__(self, path: str, model: str, dimensions: int):
+        """
+        Open (or create) the cache index and vectors file.
+
+        Args:
+            path: SQLite index file path (the vectors file is created next to it)
+            model: Embedding model name
+            dimensions: Embedding dimensions
+        """
+        self.path = Path(path)
+        self.model = model
+        self.dimensions = dimensions
+        self.vectors_path = self.path.parent / f"{model}-{dimensions}.i8"
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS idx ("
+                "hash TEXT, model TEXT, dims INT, row_id INT, scale REAL, "
+                "PRIMARY KEY (hash, model, dims))"
+            )
+            (self._size,) = conn.execute(
+                "SELECT COALESCE(MAX(row_id) + 1, 0) FROM idx WHERE model = ? AND dims = ?",
+                [self.model, self.dimensions],
+            ).fetchone()
+
+        capacity = self.vectors_path.stat().st_size // dimensions if self.vectors_path.exists() else 0
+
+        # The index must never point past the end of the vectors file (missing or
+        # truncated file): those rows would read back as zeros or raise, so drop them
+        if capacity < self._size:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM idx WHERE model = ? AND dims = ?", [self.model, self.dimensions])
+            self._size = 0
+
+        if capacity > 0:
+            self._vectors = np.memmap(self.vectors_path, dtype=np.int8, mode="r+", shape=(capacity, dimensions))
+        else:
+            self._vectors = np.memmap(self.vectors_path, dtype=np.int8, mode="w+", shape=(_INITIAL_CAPACITY, dimensions))
+
+        # Both namespaces ingest concurrently; row allocation and file growth must not interleave
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived connection (safe to use from worker threads), commit and close."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def lookup(self, hashes: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Fetch cached vectors for the given content hashes.
+
+        Args:
+            hashes: Content hashes to look up
+
+        Returns:
+            Dict[str, np.ndarray]: Vectors for the hashes that were found
+        """
+        unique = list(dict.fromkeys(hashes))
+        found_hashes: List[str] = []
+        row_ids: List[int] = []
+        scales: List[float] = []
+
+        with self._connect() as conn:
+            for start in range(0, len(unique), _LOOKUP_BATCH):
+                batch = unique[start:start + _LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT hash, row_id, scale FROM idx WHERE model = ? AND dims = ? AND hash IN ({placeholders})",
+                    [self.model, self.dimensions, *batch],
+                )
+                for h, row_id, scale in rows:
+                    found_hashes.append(h)
+                    row_ids.append(row_id)
+                    scales.append(scale)
+
+        if not found_hashes:
+            return {}
+
+        # One gather from the memmap, dequantized as a single (n, dims) array
+        with self._lock:
+            quantized = self._vectors[np.asarray(row_ids, dtype=np.int64)]
+        vectors = quantized.astype(np.float32) * np.asarray(scales, dtype=np.float32)[:, None]
+
+        return dict(zip(found_hashes, vectors))
+
+    def write(self, items: Dict[str, List[float]]):
+        """
+        Store vectors for the given content hashes.
+
+        Args:
+            items: Mapping of content hash to embedding
+        """
+        if not items:
+            return
+
+        # Symmetric int8 quantization with a per-vector scale of max|v| / 127
+        matrix = np.asarray(list(items.values()), dtype=np.float32)
+        scales = np.abs(matrix).max(axis=1) / 127
+        safe_scales = np.where(scales > 0, scales, 1.0)
+        quantized = np.round(matrix / safe_scales[:, None]).astype(np.int8)
+
+        with self._lock:
+            start = self._size
+            end = start + len(items)
+            self._ensure_capacity(end)
+            self._vectors[start:end] = quantized
+            self._vectors.flush()
+            self._size = end
+
+            # Index rows are committed only after their vectors are on disk
+            rows = [
+                (h, self.model, self.dimensions, row_id, float(scale))
+                for row_id, (h, scale) in enumerate(zip(items, scales), start)
+            ]
+            with self._connect() as conn:
+                conn.executemany("INSERT OR REPLACE INTO idx VALUES (?, ?, ?, ?, ?)", rows)
+
+    def _ensure_capacity(self, rows: int):
+        """Grow the vectors file (doubling) until it holds at least this many rows (caller holds the lock)."""
+        capacity = self._vectors.shape[0]
+        if rows <= capacity:
+            return
+
+        while capacity < rows:
+            capacity *= 2
+
+        self._vectors.flush()
+        del self._vectors
+        with open(self.vectors_path, "r+b") as f:
+            f.truncate(capacity * self.dimensions)
+        self._vectors = np.memmap(self.vectors_path, dtype=np.int8, mode="r+", shape=(capacity, self.dimensions))
@@ -2,58 +2,68 @@
 Main ingestion script for the Agentic RAG system.
 Orchestrates document processing and storage.
 """
+import asyncio
+
 import Agent.config as config
 from document_processor import process_documents
 from vectorstore_manager import VectorStoreManager
-from utils import print_section_header, print_success_message, print_document_sample
+from utils import log, print_section_header, print_success_message, print_document_sample
 
 
-def main():
-    """Main function to orchestrate document and ground truth ingestion."""
+async def _ingest_ground_truth(manager: VectorStoreManager) -> int:
+    """Load the ground truth file, then embed and upsert it (independent of the PDFs)."""
+    qa_pairs = await asyncio.to_thread(manager.load_ground_truth, config.GROUND_TRUTH_JSON)
+    return await asyncio.to_thread(manager.store_qa_pairs, qa_pairs)
+
+
+async def _main_async():
+    """
+    Run the ingestion stages, overlapping independent work.
+    
+    The ground truth path (load, embed, upsert) runs as its own task from the
+    start, alongside PDF processing (CPU-bound) and the documents upload.
+    """
     
     print_section_header("🚀 AGENTIC RAG DATA INGESTION PIPELINE")
     
     # ============================================
-    # PART 1: PROCESS RESEARCH DOCUMENTS
+    # PART 1: INITIALIZE VECTOR STORE MANAGER
     # ============================================
     
-    print_section_header("PART 1: Processing Research Documents")
+    print_section_header("PART 1: Initializing Vector Store Manager")
     
-    # Process documents with Docling
-    chunks = process_documents()
-    
-    # Show sample
-    print_document_sample(chunks, num_samples=2)
+    manager = VectorStoreManager()
     
     # ============================================
-    # PART 2: INITIALIZE VECTOR STORE MANAGER
+    # PART 2: PROCESS RESEARCH DOCUMENTS (GROUND TRUTH STORED IN PARALLEL)
     # ============================================
     
-    print_section_header("PART 2: Initializing Vector Store Manager")
-    
-    manager = VectorStoreManager()
+    print_section_header("PART 2: Processing Research Documents (ground truth stored in parallel)")
     
-    # ============================================
-    # PART 3: STORE DOCUMENTS IN PINECONE
-    # ============================================
+    # Ground truth doesn't depend on the PDFs, so it is loaded, embedded and upserted meanwhile
+    gt_task = asyncio.create_task(_ingest_ground_truth(manager))
     
-    print_section_header("PART 3: Storing Documents in Pinecone")
+    # Process documents with Docling
+    chunks = await asyncio.to_thread(process_documents)
     
-    docs_vs = manager.store_documents(chunks)
+    # Show sample
+    print_document_sample(chunks, num_samples=2)
     
     # ============================================
-    # PART 4: STORE GROUND TRUTH IN PINECONE
+    # PART 3: STORE DOCUMENTS IN PINECONE
     # ============================================
     
-    print_section_header("PART 4: Storing Ground Truth in Pinecone")
+    print_section_header("PART 3: Storing Documents in Pinecone")
     
-    gt_vs = manager.store_ground_truth(config.GROUND_TRUTH_JSON)
+    # Both namespaces share the manager's index handle
+    docs_stored = await asyncio.to_thread(manager.store_documents, chunks)
+    gt_stored = await gt_task
     
     # ============================================
-    # PART 5: VERIFY STORAGE
+    # PART 4: VERIFY STORAGE
     # ============================================
     
-    print_section_header("PART 5: Verification")
+    print_section_header("PART 4: Verification")
     
     stats = manager.check_index_stats()
     
@@ -63,13 +73,19 @@ def main():
     
     print_success_message("DATA INGESTION COMPLETED SUCCESSFULLY!")
     
-    print("📌 Summary:")
-    print(f"  • Processed {len(chunks)} document chunks from {len(config.PDFS)} papers")
-    print(f"  • Stored in Pinecone index: {config.PINECONE_INDEX_NAME}")
-    print(f"  • Research documents namespace: '{config.DOCS_NAMESPACE or 'default'}'")
-    print(f"  • Ground truth namespace: '{config.GROUND_TRUTH_NAMESPACE}'")
-    print(f"  • Total vectors in index: {stats['total_vector_count']:,}")
-    print("\n✨ System ready for Agentic RAG workflow!\n")
+    log("📌 Summary:")
+    log(f"  • Processed {len(chunks)} document chunks from {len(config.PDFS)} papers")
+    log(f"  • Upserted {docs_stored} document vectors and {gt_stored} ground truth vectors")
+    log(f"  • Stored in Pinecone index: {config.PINECONE_INDEX_NAME}")
+    log(f"  • Research documents namespace: '{config.DOCS_NAMESPACE or 'default'}'")
+    log(f"  • Ground truth namespace: '{config.GROUND_TRUTH_NAMESPACE}'")
+    log(f"  • Total vectors in index: {stats['total_vector_count']:,}")
+    log("\n✨ System ready for Agentic RAG workflow!\n")
+
+
+def main():
+    """Main function to orchestrate document and ground truth ingestion."""
+    asyncio.run(_main_async())
 
 
 if __name__ == "__main__":
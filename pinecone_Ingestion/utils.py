@@ -2,9 +2,25 @@
 Utility functions for the Agentic RAG system.
 """
 from typing import List
+import os
+import sys
 from langchain_core.documents import Document
 
 
+# Banner rules, built once
+_BAR60 = "=" * 60
+_BAR80 = "=" * 80
+
+# Set INGEST_VERBOSE=0 to silence banners and progress output (e.g. when the ingest is driven from other code)
+VERBOSE = os.getenv("INGEST_VERBOSE", "1") == "1"
+
+
+def log(*args, **kwargs):
+    """print() that respects INGEST_VERBOSE; used for all ingestion progress output."""
+    if VERBOSE:
+        print(*args, **kwargs)
+
+
 def print_document_sample(docs: List[Document], num_samples: int = 1):
     """
     Print sample documents for inspection.
@@ -13,27 +29,33 @@ def print_document_sample(docs: List[Document], num_samples: int = 1):
         docs: List of documents
         num_samples: Number of samples to print
     """
-    print(f"\n{'='*60}")
-    print(f"📄 DOCUMENT SAMPLES ({num_samples})")
-    print(f"{'='*60}\n")
+    if not VERBOSE:
+        return
+    
+    # Assemble the whole block and write it once (one stdout write instead of one per line)
+    parts = [f"\n{_BAR60}\n📄 DOCUMENT SAMPLES ({num_samples})\n{_BAR60}\n\n"]
     
     for i, doc in enumerate(docs[:num_samples], 1):
-        print(f"Sample {i}:")
-        print(f"  Metadata: {doc.metadata}")
-        print(f"  Content length: {len(doc.page_content)} characters")
-        print(f"  Content preview: {doc.page_content[:200]}...")
-        print()
+        parts.append(
+            f"Sample {i}:\n"
+            f"  Metadata: {doc.metadata}\n"
+            f"  Content length: {len(doc.page_content)} characters\n"
+            f"  Content preview: {doc.page_content[:200]}...\n"
+            "\n"
+        )
+    
+    sys.stdout.write("".join(parts))
 
 
 def print_section_header(title: str):
     """Print a formatted section header."""
-    print(f"\n{'='*80}")
-    print(f"  {title}")
-    print(f"{'='*80}\n")
+    if not VERBOSE:
+        return
+    sys.stdout.write(f"\n{_BAR80}\n  {title}\n{_BAR80}\n\n")
 
 
 def print_success_message(message: str):
     """Print a success message."""
-    print(f"\n{'='*80}")
-    print(f"✅ {message}")
-    print(f"{'='*80}\n")
\ No newline at end of file
+    if not VERBOSE:
+        return
+    sys.stdout.write(f"\n{_BAR80}\n✅ {message}\n{_BAR80}\n\n")
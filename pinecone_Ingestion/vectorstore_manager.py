@@ -2,15 +2,85 @@
 Vector store management module.
 Handles Pinecone storage operations for both documents and ground truth.
 """
-from typing import List
-import json
+from typing import Dict, List, Optional, Set, Tuple
+from functools import lru_cache
+import hashlib
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from langchain_pinecone import PineconeVectorStore
+import numpy as np
 from langchain_openai import OpenAIEmbeddings
 from langchain_core.documents import Document
 from pinecone import Pinecone
+from pinecone.exceptions import PineconeApiException
+import orjson
+import tiktoken
+from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+from tenacity import RetryCallState, Retrying, retry_if_exception, stop_after_attempt, wait_random_exponential
 
 import Agent.config as config
+from embedding_cache import EmbeddingCache, content_hash
+from _gt_build import build_contents
+from utils import log
+
+
+# Banner rule, built once
+_BAR60 = "=" * 60
+
+
+# OpenAI failures worth retrying (429s, timeouts, dropped connections, 5xx)
+_TRANSIENT_OPENAI_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+# Rows compared per matrix product when pruning near-duplicate chunks
+_DEDUP_BLOCK_SIZE = 1024
+
+# IDs per fetch request when checking which records Pinecone already holds
+_FETCH_BATCH_SIZE = 100
+
+# Jittered exponential backoff used when the server gives no Retry-After
+_backoff = wait_random_exponential(multiplier=1, max=60)
+
+
+def _wait_retry_after(retry_state: RetryCallState) -> float:
+    """Sleep for the server's Retry-After when it sends one, otherwise back off exponentially."""
+    error = retry_state.outcome.exception()
+    # OpenAI errors carry an httpx response; Pinecone exceptions expose headers directly
+    headers = getattr(getattr(error, "response", None), "headers", None) or getattr(error, "headers", None)
+    if headers:
+        try:
+            return min(float(headers.get("retry-after")), 60.0)
+        except (TypeError, ValueError):
+            pass
+    return _backoff(retry_state)
+
+
+def _is_transient(error: BaseException) -> bool:
+    """True for rate limits, timeouts and server errors; permanent 4xx errors fail immediately."""
+    if isinstance(error, _TRANSIENT_OPENAI_ERRORS):
+        return True
+    if isinstance(error, PineconeApiException):
+        status = getattr(error, "status", None) or 0
+        return status == 429 or status >= 500
+    return False
+
+
+_retry_policy = Retrying(
+    retry=retry_if_exception(_is_transient),
+    wait=_wait_retry_after,
+    stop=stop_after_attempt(6),
+    reraise=True
+)
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> tiktoken.Encoding:
+    """Tokenizer for the embedding model (loaded once, on first use)."""
+    return tiktoken.encoding_for_model(config.EMBEDDING_MODEL)
+
+
+def _with_retry(fn, *args, **kwargs):
+    """Call fn, retrying transient embedding / upsert errors."""
+    return _retry_policy.copy()(fn, *args, **kwargs)
 
 
 class VectorStoreManager:
@@ -18,34 +88,37 @@ class VectorStoreManager:
     
     def __init__(self):
         """Initialize embeddings and vector stores."""
-        print(f"\n{'='*60}")
-        print("🔧 INITIALIZING VECTOR STORE MANAGER")
-        print(f"{'='*60}\n")
+        log(f"\n{_BAR60}")
+        log("🔧 INITIALIZING VECTOR STORE MANAGER")
+        log(f"{_BAR60}\n")
         
-        # Initialize embeddings
+        # Initialize embeddings (chunk_size = texts per embeddings API request).
+        # Client retries are off: _retry_policy is the single retry layer
         self.embeddings = OpenAIEmbeddings(
             model=config.EMBEDDING_MODEL,
             dimensions=config.EMBEDDING_DIMENSIONS,
-            openai_api_key=config.OPENAI_API_KEY
+            openai_api_key=config.OPENAI_API_KEY,
+            chunk_size=config.EMBEDDING_BATCH_SIZE,
+            max_retries=0
         )
-        print(f"✓ Embeddings initialized: {config.EMBEDDING_MODEL} ({config.EMBEDDING_DIMENSIONS}D)")
+        log(f"✓ Embeddings initialized: {config.EMBEDDING_MODEL} ({config.EMBEDDING_DIMENSIONS}D)")
         
-        # Initialize Pinecone vector stores
-        self.docs_vectorstore = PineconeVectorStore(
-            index_name=config.PINECONE_INDEX_NAME,
-            embedding=self.embeddings,
-            namespace=config.DOCS_NAMESPACE
+        # Local cache so unchanged chunks are never re-embedded
+        self.embedding_cache = EmbeddingCache(
+            config.INGEST_EMBEDDING_CACHE_PATH,
+            model=config.EMBEDDING_MODEL,
+            dimensions=config.EMBEDDING_DIMENSIONS
         )
-        print(f"✓ Documents vector store ready (namespace: '{config.DOCS_NAMESPACE or 'default'}')")
+        log(f"✓ Embedding cache ready: {config.INGEST_EMBEDDING_CACHE_PATH}")
         
-        self.ground_truth_vectorstore = PineconeVectorStore(
-            index_name=config.PINECONE_INDEX_NAME,
-            embedding=self.embeddings,
-            namespace=config.GROUND_TRUTH_NAMESPACE
-        )
-        print(f"✓ Ground truth vector store ready (namespace: '{config.GROUND_TRUTH_NAMESPACE}')")
+        # One Pinecone client + index shared by both namespaces; pool_threads lets
+        # upsert batches (from either namespace) run in parallel over the same connections
+        self._pc = Pinecone(api_key=config.PINECONE_API_KEY, pool_threads=config.PINECONE_POOL_THREADS)
+        self._index = self._pc.Index(config.PINECONE_INDEX_NAME, pool_threads=config.PINECONE_POOL_THREADS)
+        log(f"✓ Pinecone index ready: {config.PINECONE_INDEX_NAME} "
+              f"(namespaces: '{config.DOCS_NAMESPACE or 'default'}', '{config.GROUND_TRUTH_NAMESPACE}')")
     
-    def store_documents(self, documents: List[Document]) -> PineconeVectorStore:
+    def store_documents(self, documents: List[Document]) -> int:
         """
         Store research documents in Pinecone (default namespace).
         
@@ -53,21 +126,442 @@ class VectorStoreManager:
             documents: List of document chunks to store
             
         Returns:
-            PineconeVectorStore: The vector store with stored documents
+            int: Number of document vectors upserted in this run
+        """
+        # Runs alongside the ground truth store: print each block in one call and
+        # tag progress lines, so the two outputs don't interleave line by line
+        log(
+            f"\n{_BAR60}\n"
+            "💾 STORING DOCUMENTS IN PINECONE\n"
+            f"{_BAR60}\n\n"
+            f"Storing {len(documents)} document chunks...\n"
+            f"  • Index: {config.PINECONE_INDEX_NAME}\n"
+            f"  • Namespace: {config.DOCS_NAMESPACE or '(default)'}\n"
+            f"  • Batch size: {config.UPSERT_BATCH_SIZE} ({config.PINECONE_POOL_THREADS} upsert threads)"
+        )
+        
+        texts = [d.page_content for d in documents]
+        clipped = self._clip_texts(texts)
+        ids = [self._document_id(config.DOCS_NAMESPACE, text) for text in texts]
+        
+        # Resume: skip chunks whose batch was already upserted by an earlier (interrupted) run.
+        # The progress file is per index + namespace and is removed once a run completes;
+        # it is ignored if the namespace is empty (e.g. the index was recreated).
+        progress_path = config.INGEST_PROGRESS_PATH.format(
+            index=config.PINECONE_INDEX_NAME,
+            namespace=config.DOCS_NAMESPACE or "default"
+        )
+        done = self._load_progress(progress_path)
+        if done and self._namespace_vector_count(config.DOCS_NAMESPACE) == 0:
+            log("  [documents] ⚠️  Progress file found but the namespace is empty; ignoring it")
+            done = set()
+            Path(progress_path).unlink(missing_ok=True)
+        pending = [i for i, vector_id in enumerate(ids) if vector_id not in done]
+        if len(pending) < len(ids):
+            log(f"  [documents] ✓ Resuming: {len(ids) - len(pending)} chunks already upserted")
+        texts = [texts[i] for i in pending]
+        ids = [ids[i] for i in pending]
+        metadatas = [documents[i].metadata for i in pending]
+        
+        # Embed in large batches, then upsert the vectors to the default namespace
+        vectors, unchanged = self._embed_texts(
+            texts, metadatas, config.DOCS_NAMESPACE, ids, label="documents"
+        )
+        
+        # Drop near-duplicate chunks (e.g. from overlapping windows) before upserting.
+        # On a resumed run only the remaining chunks are compared with each other,
+        # not with chunks upserted by the interrupted run.
+        keep = self._near_duplicate_filter(vectors)
+        log(f"  [documents] ✓ Near-duplicates pruned: {len(texts) - len(keep)} (similarity > {config.DEDUP_SIMILARITY_THRESHOLD})")
+        
+        # Chunks already stored unchanged are left alone (their cached vectors are int8)
+        upsert = [i for i in keep if i not in unchanged]
+        self._upsert_embeddings(
+            texts=[texts[i] for i in upsert],
+            vectors=[vectors[i] for i in upsert],
+            metadatas=[metadatas[i] for i in upsert],
+            namespace=config.DOCS_NAMESPACE,
+            ids=[ids[i] for i in upsert],
+            progress_path=progress_path
+        )
+        
+        # Everything is upserted; the next run starts from scratch (IDs make that idempotent)
+        Path(progress_path).unlink(missing_ok=True)
+        
+        summary = f"\n✓ Successfully stored {len(upsert)} documents! ({len(keep) - len(upsert)} already up to date)"
+        if clipped:
+            summary += f"\n  ⚠️  {clipped} chunks clipped to {config.MAX_CONTENT_CHARS} characters"
+        log(summary)
+        return len(upsert)
+    
+    @staticmethod
+    def _near_duplicate_filter(
+        vectors: List[List[float]],
+        threshold: float = config.DEDUP_SIMILARITY_THRESHOLD,
+        block_size: int = _DEDUP_BLOCK_SIZE
+    ) -> List[int]:
+        """
+        Find the chunks to keep, dropping any whose cosine similarity to an earlier kept chunk exceeds threshold.
+        
+        Vectors are L2-normalized once, then compared a block at a time with
+        matrix products (against all kept rows so far, and within the block).
+        
+        Args:
+            vectors: Embeddings in chunk order
+            threshold: Cosine similarity above which a chunk counts as a duplicate
+            block_size: Rows compared per matrix product
+            
+        Returns:
+            List[int]: Indices of the chunks to keep, in order
+        """
+        if not vectors:
+            return []
+        
+        X = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(X, axis=1, keepdims=True)
+        X /= np.where(norms > 0, norms, 1.0)
+        
+        kept: List[int] = []
+        for start in range(0, len(X), block_size):
+            block = X[start:start + block_size]
+            
+            # Duplicates of rows kept in earlier blocks
+            if kept:
+                duplicate = (block @ X[kept].T).max(axis=1) > threshold
+            else:
+                duplicate = np.zeros(len(block), dtype=bool)
+            
+            # Within the block, each surviving row knocks out the later rows it is close to
+            within = (block @ block.T) > threshold
+            later = np.arange(len(block))
+            for i in range(len(block)):
+                if not duplicate[i]:
+                    kept.append(start + i)
+                    duplicate |= within[i] & (later > i)
+        
+        return kept
+    
+    @staticmethod
+    def _fit_metadata(
+        text: str,
+        metadata: dict,
+        gold_chunks: List[str],
+        max_bytes: int = config.METADATA_MAX_BYTES
+    ) -> Tuple[str, bool]:
+        """
+        Shrink a ground truth record until its stored metadata (including the text) fits max_bytes.
+        
+        Gold chunks are cut to the first 3, then fewer, then dropped; only if that
+        is still too large is the text (then answer/question) clipped. Metadata is
+        updated in place.
+        
+        Args:
+            text: Record text (stored under the "text" metadata key)
+            metadata: Record metadata
+            gold_chunks: The record's full gold chunks
+            max_bytes: Maximum serialized metadata size
+            
+        Returns:
+            Tuple[str, bool]: The (possibly clipped) text, and whether anything was shrunk
+        """
+        def overflow() -> int:
+            return len(orjson.dumps({**metadata, "text": text})) - max_bytes
+        
+        if overflow() <= 0:
+            return text, False
+        
+        metadata["gold_chunks_truncated"] = True
+        for keep in range(min(3, len(gold_chunks)), -1, -1):
+            if keep:
+                metadata["gold_chunks"] = orjson.dumps(gold_chunks[:keep]).decode()
+            else:
+                metadata.pop("gold_chunks", None)
+            if overflow() <= 0:
+                return text, True
+        
+        # Then clip the text, and as a last resort the answer/question metadata.
+        # Every character serializes to at least one byte, so cutting `overflow`
+        # characters always removes enough
+        text = text[:max(len(text) - overflow(), 0)]
+        for key in ("answer", "question"):
+            if overflow() > 0:
+                metadata[key] = metadata[key][:max(len(metadata[key]) - overflow(), 0)]
+        return text, True
+    
+    @staticmethod
+    def _clip_texts(texts: List[str], max_chars: int = config.MAX_CONTENT_CHARS) -> int:
+        """
+        Clip texts in place to max_chars so oversized records can't fail an upsert batch.
+        
+        Args:
+            texts: Texts to clip
+            max_chars: Maximum characters kept per text
+            
+        Returns:
+            int: Number of texts that were clipped
+        """
+        clipped = 0
+        for i, text in enumerate(texts):
+            if len(text) > max_chars:
+                texts[i] = text[:max_chars]
+                clipped += 1
+        return clipped
+    
+    @staticmethod
+    def _document_id(namespace: str, text: str) -> str:
+        """
+        Stable vector ID for a chunk: the same content always maps to the same ID.
+        
+        This is the Pinecone-side counterpart of the embedding cache key, so a
+        re-ingest overwrites unchanged chunks instead of duplicating them.
+        
+        Args:
+            namespace: Target Pinecone namespace
+            text: Chunk text
+            
+        Returns:
+            str: 24-character hex ID
+        """
+        return hashlib.sha1((namespace + text).encode("utf-8")).hexdigest()[:24]
+    
+    def _embed_texts(
+        self,
+        texts: List[str],
+        metadatas: List[dict],
+        namespace: str,
+        ids: List[str],
+        label: str
+    ) -> Tuple[List[List[float]], Set[int]]:
+        """
+        Embed texts, serving unchanged ones from the local embedding cache.
+        
+        Cached vectors are int8-quantized, so one is only used when Pinecone
+        already holds the same record (which then needs no upsert). Every
+        vector that will be upserted comes from the API at full precision.
+        
+        Args:
+            texts: Texts to embed
+            metadatas: Metadata each record will be stored with
+            namespace: Target Pinecone namespace
+            ids: Vector ID of each record
+            label: Tag for the progress line (which store is embedding)
+            
+        Returns:
+            Tuple[List[List[float]], Set[int]]: Embeddings in the same order as texts,
+            and the positions of records already stored unchanged (skip their upsert)
         """
-        print(f"\n{'='*60}")
-        print("💾 STORING DOCUMENTS IN PINECONE")
-        print(f"{'='*60}\n")
+        # 1. Hash every text and 2. look all hashes up in one pass
+        hashes = [content_hash(text) for text in texts]
+        cached = self.embedding_cache.lookup(hashes)
+        
+        # 3. Keep cached vectors only for records Pinecone already holds unchanged
+        hits = [i for i, h in enumerate(hashes) if h in cached]
+        stored = self._stored_unchanged(
+            namespace,
+            {ids[i]: {**metadatas[i], "text": texts[i]} for i in hits}
+        )
+        unchanged = {i for i in hits if ids[i] in stored}
+        
+        # 4. Embed everything else, once per distinct text (duplicates within a run share a call)
+        misses = {hashes[i]: texts[i] for i in range(len(texts)) if i not in unchanged}
+        fresh = dict(zip(misses, self._embed_concurrent(list(misses.values())))) if misses else {}
+        
+        # 5. Write new vectors back to the cache
+        self.embedding_cache.write({h: vector for h, vector in fresh.items() if h not in cached})
         
-        print(f"Storing {len(documents)} document chunks...")
-        print(f"  • Index: {config.PINECONE_INDEX_NAME}")
-        print(f"  • Namespace: {config.DOCS_NAMESPACE or '(default)'}")
+        # 6. Merge cached + fresh vectors in input order
+        vectors = [cached[h].tolist() if i in unchanged else fresh[h] for i, h in enumerate(hashes)]
         
-        # Add documents to default namespace
-        self.docs_vectorstore.add_documents(documents)
+        log(f"  [{label}] ✓ Embeddings: {len(texts)} texts, {len(fresh)} embedded, {len(unchanged)} unchanged (cached)")
+        return vectors, unchanged
+    
+    def _stored_unchanged(self, namespace: str, expected: Dict[str, dict]) -> Set[str]:
+        """
+        Find records that Pinecone already stores with exactly the expected metadata.
+        
+        Args:
+            namespace: Pinecone namespace to check
+            expected: Metadata (including "text") per vector ID
+            
+        Returns:
+            Set[str]: IDs whose stored metadata matches
+        """
+        if not expected:
+            return set()
+        
+        def fetch(batch_ids: List[str]) -> dict:
+            return _with_retry(self._index.fetch, ids=batch_ids, namespace=namespace).vectors
+        
+        all_ids = list(expected)
+        batches = [all_ids[i:i + _FETCH_BATCH_SIZE] for i in range(0, len(all_ids), _FETCH_BATCH_SIZE)]
+        
+        stored: Set[str] = set()
+        with ThreadPoolExecutor(max_workers=config.PINECONE_POOL_THREADS) as executor:
+            for found in executor.map(fetch, batches):
+                stored.update(
+                    vector_id for vector_id, vector in found.items()
+                    if dict(vector.metadata or {}) == expected[vector_id]
+                )
+        return stored
+    
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed one batch, backing off on rate limits and timeouts."""
+        return _with_retry(self.embeddings.embed_documents, texts)
+    
+    @staticmethod
+    def _pack_batches(
+        texts: List[str],
+        max_texts: int = config.EMBEDDING_BATCH_SIZE,
+        max_tokens: int = config.EMBEDDING_MAX_BATCH_TOKENS
+    ) -> List[Tuple[int, int]]:
+        """
+        Greedily pack consecutive texts into batches that fit the embeddings request limits.
+        
+        Args:
+            texts: Texts to embed
+            max_texts: Maximum texts per request
+            max_tokens: Maximum total tokens per request
+            
+        Returns:
+            List[Tuple[int, int]]: (start, end) slice bounds of each batch, in order
+        """
+        # Token counts for all texts in one call (tiktoken encodes the batch on its own threads)
+        token_counts = [len(tokens) for tokens in _get_encoding().encode_batch(texts, disallowed_special=())]
+        
+        batches: List[Tuple[int, int]] = []
+        start, batch_tokens = 0, 0
+        for i, n_tokens in enumerate(token_counts):
+            if i > start and (i - start >= max_texts or batch_tokens + n_tokens > max_tokens):
+                batches.append((start, i))
+                start, batch_tokens = i, 0
+            batch_tokens += n_tokens
+        if start < len(texts):
+            batches.append((start, len(texts)))
+        
+        return batches
+    
+    def _embed_concurrent(
+        self,
+        texts: List[str],
+        max_concurrency: int = config.EMBEDDING_MAX_CONCURRENCY
+    ) -> List[List[float]]:
+        """
+        Embed texts in token-packed batches, with several batches in flight at once.
+        
+        Args:
+            texts: Texts to embed
+            max_concurrency: Maximum number of concurrent requests
+            
+        Returns:
+            List[List[float]]: Embeddings in the same order as texts
+        """
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+        
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = {
+                executor.submit(self._embed_batch, texts[start:end]): start
+                for start, end in self._pack_batches(texts)
+            }
+            # Write each batch back at its offset so order matches the input
+            for future in as_completed(futures):
+                start = futures[future]
+                batch_vectors = future.result()
+                vectors[start:start + len(batch_vectors)] = batch_vectors
         
-        print(f"\n✓ Successfully stored {len(documents)} documents!")
-        return self.docs_vectorstore
+        return vectors
+    
+    def _upsert_embeddings(
+        self,
+        texts: List[str],
+        vectors: List[List[float]],
+        metadatas: List[dict],
+        namespace: str,
+        ids: Optional[List[str]] = None,
+        progress_path: Optional[str] = None
+    ) -> List[str]:
+        """
+        Upsert precomputed embeddings into a Pinecone namespace.
+        
+        Each text is stored under the "text" metadata key, which is where
+        the agent's retrieval reads it back from.
+        
+        Args:
+            texts: Chunk texts
+            vectors: Embeddings for each text
+            metadatas: Metadata for each text
+            namespace: Target Pinecone namespace
+            ids: Vector IDs (random UUIDs if not given)
+            progress_path: If given, append each batch's IDs here once it is upserted
+            
+        Returns:
+            List[str]: IDs of the upserted vectors
+        """
+        ids = ids or [str(uuid.uuid4()) for _ in texts]
+        records = [
+            (vector_id, vector, {**metadata, "text": text})
+            for vector_id, vector, metadata, text in zip(ids, vectors, metadatas, texts)
+        ]
+        
+        # Fire all batches on the index thread pool, then wait for them
+        batch_size = config.UPSERT_BATCH_SIZE
+        batches = [records[i:i + batch_size] for i in range(0, len(records), batch_size)]
+        async_results = [
+            self._index.upsert(vectors=batch, namespace=namespace, async_req=True)
+            for batch in batches
+        ]
+        progress = None
+        if progress_path:
+            Path(progress_path).parent.mkdir(parents=True, exist_ok=True)
+            progress = open(progress_path, "a", encoding="utf-8")
+        try:
+            for batch, result in zip(batches, async_results):
+                try:
+                    result.get()
+                except Exception as e:
+                    if not _is_transient(e):
+                        raise
+                    # Re-send only the failed batch, with backoff
+                    _with_retry(self._index.upsert, vectors=batch, namespace=namespace)
+                
+                # Checkpoint the batch so an interrupted run can resume after it
+                if progress:
+                    progress.write(orjson.dumps({"ids": [record[0] for record in batch]}).decode() + "\n")
+                    progress.flush()
+        finally:
+            if progress:
+                progress.close()
+        
+        return ids
+    
+    def _namespace_vector_count(self, namespace: str) -> int:
+        """Return the number of vectors currently stored in a namespace."""
+        stats = self._index.describe_index_stats()
+        return stats.get('namespaces', {}).get(namespace, {}).get('vector_count', 0)
+    
+    @staticmethod
+    def _load_progress(progress_path: str) -> Set[str]:
+        """
+        Read the IDs recorded by earlier runs in the progress file.
+        
+        Args:
+            progress_path: Path to the progress JSONL file
+            
+        Returns:
+            Set[str]: IDs of vectors already upserted
+        """
+        done: Set[str] = set()
+        path = Path(progress_path)
+        if not path.exists():
+            return done
+        
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    done.update(orjson.loads(line)["ids"])
+                except (orjson.JSONDecodeError, KeyError):
+                    # A run killed mid-write can leave a partial last line
+                    continue
+        return done
     
     def load_ground_truth(self, json_path: str) -> List[dict]:
         """
@@ -83,106 +577,132 @@ class VectorStoreManager:
         Returns:
             List[dict]: List of Q&A pairs
         """
-        print(f"\n{'='*60}")
-        print("📖 LOADING GROUND TRUTH")
-        print(f"{'='*60}\n")
+        log(f"\n{_BAR60}")
+        log("📖 LOADING GROUND TRUTH")
+        log(f"{_BAR60}\n")
         
         if not Path(json_path).exists():
             raise FileNotFoundError(f"Ground truth file not found: {json_path}")
         
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # orjson parses the raw bytes directly (no intermediate str decode)
+        with open(json_path, 'rb') as f:
+            data = orjson.loads(f.read())
         
         # Handle different JSON formats
         if isinstance(data, list):
             # Array format: [{"paper": "...", "question": "...", ...}, ...]
             qa_pairs = data
-            print(f"✓ Detected array format")
+            log(f"✓ Detected array format")
         elif isinstance(data, dict) and "qa_pairs" in data:
             # Object format: {"qa_pairs": [...]}
             qa_pairs = data["qa_pairs"]
-            print(f"✓ Detected object format with 'qa_pairs' key")
+            log(f"✓ Detected object format with 'qa_pairs' key")
         else:
             raise ValueError("Invalid JSON format. Expected either a list or an object with 'qa_pairs' key")
         
         if not qa_pairs:
             raise ValueError("No Q&A pairs found in ground truth JSON")
         
-        print(f"✓ Loaded {len(qa_pairs)} ground truth Q&A pairs from {json_path}")
+        log(f"✓ Loaded {len(qa_pairs)} ground truth Q&A pairs from {json_path}")
         
         # Show sample
         if qa_pairs:
             sample = qa_pairs[0]
-            print(f"\n📄 Sample Q&A pair:")
-            print(f"  • Paper: {sample.get('paper', 'N/A')}")
-            print(f"  • Question: {sample.get('question', 'N/A')[:60]}...")
-            print(f"  • Answer: {sample.get('answer', 'N/A')[:60]}...")
-            print(f"  • Gold chunks: {len(sample.get('gold_chunks', []))} chunks")
+            log(f"\n📄 Sample Q&A pair:")
+            log(f"  • Paper: {sample.get('paper', 'N/A')}")
+            log(f"  • Question: {sample.get('question', 'N/A')[:60]}...")
+            log(f"  • Answer: {sample.get('answer', 'N/A')[:60]}...")
+            log(f"  • Gold chunks: {len(sample.get('gold_chunks', []))} chunks")
         
         return qa_pairs
     
-    def store_ground_truth(self, json_path: str) -> PineconeVectorStore:
+    def store_ground_truth(self, json_path: str) -> int:
         """
-        Store ground truth Q&A pairs in Pinecone (ground-truth namespace).
+        Load ground truth Q&A pairs and store them in Pinecone (ground-truth namespace).
         
         Args:
             json_path: Path to the golden.json file
             
         Returns:
-            PineconeVectorStore: The vector store with stored ground truth
+            int: Number of ground truth vectors upserted
         """
-        # Load ground truth
         qa_pairs = self.load_ground_truth(json_path)
+        return self.store_qa_pairs(qa_pairs)
+    
+    def store_qa_pairs(self, qa_pairs: List[dict]) -> int:
+        """
+        Store already-loaded ground truth Q&A pairs in Pinecone (ground-truth namespace).
+        
+        Args:
+            qa_pairs: Q&A pairs as returned by load_ground_truth
+            
+        Returns:
+            int: Number of ground truth vectors upserted
+        """
+        # Build parallel field lists (one pass per field) from the Q&A pairs
+        questions = [qa.get("question", "") for qa in qa_pairs]
+        answers = [qa.get("answer", "") for qa in qa_pairs]
+        golds = [qa.get("gold_chunks", []) for qa in qa_pairs]
+        
+        # Combine question and answer (plus gold chunks if available) for embedding
+        contents = build_contents(questions, answers, golds)
         
-        print(f"\n{'='*60}")
-        print("💾 STORING GROUND TRUTH IN PINECONE")
-        print(f"{'='*60}\n")
-        
-        # Create documents from Q&A pairs
-        documents = []
-        for i, qa in enumerate(qa_pairs):
-            # Combine question and answer for embedding
-            question = qa.get("question", "")
-            answer = qa.get("answer", "")
-            content = f"Question: {question}\nAnswer: {answer}"
-            
-            # Add gold chunks if available
-            gold_chunks = qa.get("gold_chunks", [])
-            if gold_chunks:
-                content += "\n\nGold Chunks:\n" + "\n".join(gold_chunks)
-            
-            # Create metadata
-            metadata = {
+        # Metadata: paper name and gold chunks (as a JSON string) only when present;
+        # min_chunks_required defaults to the number of gold chunks
+        metadatas = [
+            {
                 "qa_id": f"gt_{i}",
-                "question": question,
-                "answer": answer,
-                "type": "ground_truth"
+                "question": q,
+                "answer": a,
+                "type": "ground_truth",
+                **({"source_paper": qa["paper"]} if "paper" in qa else {}),
+                **({"gold_chunks": orjson.dumps(g).decode(), "num_gold_chunks": len(g)} if g else {}),
+                "min_chunks_required": qa.get("min_chunks_required", len(g)),
             }
-            
-            # Add paper name
-            if "paper" in qa:
-                metadata["source_paper"] = qa["paper"]
-            
-            # Add gold chunks as JSON string
-            if gold_chunks:
-                metadata["gold_chunks"] = json.dumps(gold_chunks)
-                metadata["num_gold_chunks"] = len(gold_chunks)
-            
-            # Optional: min chunks required (default to number of gold chunks)
-            metadata["min_chunks_required"] = qa.get("min_chunks_required", len(gold_chunks))
-            
-            doc = Document(page_content=content, metadata=metadata)
-            documents.append(doc)
+            for i, (qa, q, a, g) in enumerate(zip(qa_pairs, questions, answers, golds))
+        ]
         
-        print(f"Storing {len(documents)} ground truth Q&A pairs...")
-        print(f"  • Index: {config.PINECONE_INDEX_NAME}")
-        print(f"  • Namespace: {config.GROUND_TRUTH_NAMESPACE}")
+        # Keep every record under Pinecone's metadata limit (the stored text counts too),
+        # so one oversized pair can't fail its whole upsert batch
+        clipped = self._clip_texts(contents)
+        truncated = 0
+        for i, (m, g) in enumerate(zip(metadatas, golds)):
+            contents[i], was_truncated = self._fit_metadata(contents[i], m, g)
+            truncated += was_truncated
         
-        # Add documents to ground-truth namespace
-        self.ground_truth_vectorstore.add_documents(documents)
+        # Runs alongside the documents store: one print per block (see store_documents)
+        log(
+            f"\n{_BAR60}\n"
+            "💾 STORING GROUND TRUTH IN PINECONE\n"
+            f"{_BAR60}\n\n"
+            f"Storing {len(contents)} ground truth Q&A pairs...\n"
+            f"  • Index: {config.PINECONE_INDEX_NAME}\n"
+            f"  • Namespace: {config.GROUND_TRUTH_NAMESPACE}"
+        )
+        
+        # Embed Q&A texts concurrently, then upsert the parallel lists directly
+        # (no Document wrapping) to the ground-truth namespace
+        # qa_id as the vector ID makes re-ingesting the same pairs overwrite, not duplicate
+        ids = [m["qa_id"] for m in metadatas]
+        vectors, unchanged = self._embed_texts(
+            contents, metadatas, config.GROUND_TRUTH_NAMESPACE, ids, label="ground truth"
+        )
+        
+        # Pairs already stored unchanged are left alone (their cached vectors are int8)
+        upsert = [i for i in range(len(contents)) if i not in unchanged]
+        self._upsert_embeddings(
+            texts=[contents[i] for i in upsert],
+            vectors=[vectors[i] for i in upsert],
+            metadatas=[metadatas[i] for i in upsert],
+            namespace=config.GROUND_TRUTH_NAMESPACE,
+            ids=[ids[i] for i in upsert]
+        )
         
-        print(f"\n✓ Successfully stored {len(documents)} ground truth pairs!")
-        return self.ground_truth_vectorstore
+        summary = f"\n✓ Successfully stored {len(upsert)} ground truth pairs! ({len(unchanged)} already up to date)"
+        if clipped or truncated:
+            summary += f"\n  ⚠️  {clipped} pairs clipped to {config.MAX_CONTENT_CHARS} characters, {truncated} shrunk to fit the metadata limit"
+        log(summary)
+        return len(upsert)
     
     def check_index_stats(self) -> dict:
         """
@@ -191,30 +711,29 @@ class VectorStoreManager:
         Returns:
             dict: Index statistics
         """
-        print(f"\n{'='*60}")
-        print("📊 PINECONE INDEX STATISTICS")
-        print(f"{'='*60}\n")
+        log(f"\n{_BAR60}")
+        log("📊 PINECONE INDEX STATISTICS")
+        log(f"{_BAR60}\n")
         
-        pc = Pinecone(api_key=config.PINECONE_API_KEY)
-        index = pc.Index(config.PINECONE_INDEX_NAME)
-        stats = index.describe_index_stats()
+        # Reuse the index handle from __init__ (no new client / TLS session per call)
+        stats = self._index.describe_index_stats()
         
-        print(f"Index: {config.PINECONE_INDEX_NAME}")
-        print(f"Total vectors: {stats['total_vector_count']}")
-        print(f"Dimension: {stats['dimension']}")
+        log(f"Index: {config.PINECONE_INDEX_NAME}")
+        log(f"Total vectors: {stats['total_vector_count']}")
+        log(f"Dimension: {stats['dimension']}")
         
-        print(f"\n📁 Namespaces:")
+        log(f"\n📁 Namespaces:")
         namespaces = stats.get('namespaces', {})
         
         # Default namespace (documents)
         default_count = namespaces.get('', {}).get('vector_count', 0)
-        print(f"  • (default) - Research Documents: {default_count:,} vectors")
+        log(f"  • (default) - Research Documents: {default_count:,} vectors")
         
         # Ground truth namespace
         gt_count = namespaces.get(config.GROUND_TRUTH_NAMESPACE, {}).get('vector_count', 0)
-        print(f"  • {config.GROUND_TRUTH_NAMESPACE} - Q&A Pairs: {gt_count:,} vectors")
+        log(f"  • {config.GROUND_TRUTH_NAMESPACE} - Q&A Pairs: {gt_count:,} vectors")
         
-        print(f"{'='*60}")
+        log(f"{_BAR60}")
         
         return stats
 